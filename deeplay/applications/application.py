@@ -50,6 +50,10 @@ class Application(DeeplayModule, L.LightningModule):
         test_metrics: Optional[Sequence[tm.Metric]] = None,
     ):
         super().__init__()
+
+        self._batch_indices_key = None
+        self._current_batch_size = None
+
         if loss:
             self.loss = loss
         if optimizer:
@@ -89,6 +93,9 @@ class Application(DeeplayModule, L.LightningModule):
         """Train the model on the training data.
 
         Train the model on the training data, with optional validation data.
+        When training on a CUDA device, the data loaders use pinned memory so
+        that host-to-device copies overlap with compute. When passing your own
+        DataLoader to a trainer, consider setting `pin_memory=True` as well.
 
         Parameters
         ----------
@@ -129,8 +136,12 @@ class Application(DeeplayModule, L.LightningModule):
         callbacks = callbacks + [history, progressbar]
         trainer = dl.Trainer(max_epochs=max_epochs, callbacks=callbacks, **kwargs)
 
+        # Lightning already copies batches to the device with non_blocking=True.
+        # That only overlaps with compute if the host memory is pinned.
+        pin_memory = trainer.strategy.root_device.type == "cuda"
+
         train_dataloader = torch.utils.data.DataLoader(
-            train_data, batch_size=batch_size, shuffle=True
+            train_data, batch_size=batch_size, shuffle=True, pin_memory=pin_memory
         )
 
         if not self._has_built:
@@ -140,7 +151,10 @@ class Application(DeeplayModule, L.LightningModule):
         if val_data:
             val_dataloader = (
                 torch.utils.data.DataLoader(
-                    val_data, batch_size=val_batch_size, shuffle=False
+                    val_data,
+                    batch_size=val_batch_size,
+                    shuffle=False,
+                    pin_memory=pin_memory,
                 )
                 if val_data
                 else None
@@ -185,8 +199,10 @@ class Application(DeeplayModule, L.LightningModule):
         device = self.trainer.strategy.root_device
         self.to(device)
         test_data = self.create_data(data)
+        # Pinned memory lets the copies below run asynchronously on CUDA.
+        is_cuda = device.type == "cuda"
         test_dataloader = torch.utils.data.DataLoader(
-            test_data, batch_size=batch_size, shuffle=True
+            test_data, batch_size=batch_size, shuffle=True, pin_memory=is_cuda
         )
 
         dict_metrics: Dict[str, tm.Metric]
@@ -213,10 +229,12 @@ class Application(DeeplayModule, L.LightningModule):
                 value.reset()
 
         for x, y in tqdm.tqdm(test_dataloader):
-            y_hat = self(x.to(device))
+            x = x.to(device, non_blocking=is_cuda)
+            y = y.to(device, non_blocking=is_cuda)
+            y_hat = self(x)
             for metric in dict_metrics.values():
                 metric.to(device)
-                metric.update(y_hat.to(device), y.to(device))
+                metric.update(y_hat.to(device), y)
 
         out = {name: dict_metrics[name].compute() for name in dict_metrics}
 
@@ -249,21 +267,19 @@ class Application(DeeplayModule, L.LightningModule):
         if not isinstance(loss, dict):
             loss = {"loss": loss}
 
-        for name, v in loss.items():
-            self.log(
-                f"train_{name}",
-                v,
-                on_step=True,
-                on_epoch=True,
-                prog_bar=True,
-                logger=True,
-            )
+        self.log_dict(
+            {f"train_{name}": v for name, v in loss.items()},
+            on_step=True,
+            on_epoch=True,
+            prog_bar=True,
+            logger=True,
+        )
 
         self.log_metrics(
             "train", y_hat, y, on_step=True, on_epoch=True, prog_bar=True, logger=True
         )
 
-        return sum(loss.values())
+        return self._reduce_loss(loss)
 
     def validation_step(self, batch, batch_idx):
         x, y = self.val_preprocess(batch)
@@ -272,15 +288,13 @@ class Application(DeeplayModule, L.LightningModule):
         if not isinstance(loss, dict):
             loss = {"loss": loss}
 
-        for name, v in loss.items():
-            self.log(
-                f"val_{name}",
-                v,
-                on_step=True,
-                on_epoch=True,
-                prog_bar=True,
-                logger=True,
-            )
+        self.log_dict(
+            {f"val_{name}": v for name, v in loss.items()},
+            on_step=True,
+            on_epoch=True,
+            prog_bar=True,
+            logger=True,
+        )
         self.log_metrics(
             "val",
             y_hat,
@@ -290,7 +304,7 @@ class Application(DeeplayModule, L.LightningModule):
             prog_bar=True,
             logger=True,
         )
-        return sum(loss.values())
+        return self._reduce_loss(loss)
 
     def test_step(self, batch, batch_idx):
         x, y = self.test_preprocess(batch)
@@ -299,15 +313,13 @@ class Application(DeeplayModule, L.LightningModule):
         if not isinstance(loss, dict):
             loss = {"loss": loss}
 
-        for name, v in loss.items():
-            self.log(
-                f"test_{name}",
-                v,
-                on_step=True,
-                on_epoch=True,
-                prog_bar=True,
-                logger=True,
-            )
+        self.log_dict(
+            {f"test_{name}": v for name, v in loss.items()},
+            on_step=True,
+            on_epoch=True,
+            prog_bar=True,
+            logger=True,
+        )
         self.log_metrics(
             "test",
             y_hat,
@@ -318,7 +330,19 @@ class Application(DeeplayModule, L.LightningModule):
             logger=True,
         )
 
-        return sum(loss.values())
+        return self._reduce_loss(loss)
+
+    @staticmethod
+    def _reduce_loss(loss: Dict[str, torch.Tensor]) -> torch.Tensor:
+        # Sum scalar tensor terms in a single reduction. Terms that are plain
+        # numbers or non-scalar tensors cannot be stacked, so fall back to
+        # summing them one by one.
+        values = tuple(loss.values())
+        if len(values) == 1:
+            return values[0]
+        if all(isinstance(v, torch.Tensor) and v.dim() == 0 for v in values):
+            return torch.stack(values).sum()
+        return sum(values)
 
     def predict_step(self, batch, batch_idx, dataloader_idx=None):
         if isinstance(batch, (list, tuple)):
@@ -334,39 +358,26 @@ class Application(DeeplayModule, L.LightningModule):
         metrics: tm.MetricCollection = getattr(self, f"{kind}_metrics")
         metrics(*ys)
 
-        for name, metric in metrics.items():
-            self.log(
-                name,
-                metric,
-                **logger_kwargs,
-            )
+        self.log_dict(metrics, **logger_kwargs)
 
     def metrics_preprocess(self, y_hat, y) -> Tuple[torch.Tensor, torch.Tensor]:
         return y_hat, y
 
     @L.LightningModule.trainer.setter
     def trainer(self, trainer):
-        # Call the original setter
-        L.LightningModule.trainer.fset(self, trainer)
-
-        # Overrides default implementation to do a deep search for all
-        # submodules that have a trainer attribute and set it to the
-        # same trainer instead for just direct children.
+        # Overrides default implementation, which only reaches direct
+        # children, to set the trainer on all lightning submodules, including
+        # self, in a single pass.
         for module in self.modules():
-            if module is self:
-                continue
-            try:
-                if hasattr(module, "trainer") and module.trainer is not trainer:
-                    module.trainer = trainer
-            except RuntimeError:
-                # hasattr can raise RuntimeError if the module is not attached to a trainer
-                if isinstance(module, L.LightningModule):
-                    module.trainer = trainer
+            if isinstance(module, L.LightningModule):
+                module._trainer = trainer
 
     @staticmethod
     def clone_metrics(metrics: T) -> T:
+        # All torchmetrics metrics implement clone(). copy.copy is only kept as
+        # a fallback for metric-like objects that are not tm.Metric instances.
         return [
-            metric.clone() if hasattr(metric, "clone") else copy.copy(metric)
+            metric.clone() if isinstance(metric, tm.Metric) else copy.copy(metric)
             for metric in metrics
         ]
 
@@ -388,20 +399,16 @@ class Application(DeeplayModule, L.LightningModule):
                 return self.parameters()
 
     def named_children(self) -> Iterator[Tuple[str, Module]]:
-        name_child_iterator = list(super().named_children())
         # optimizers last
-        not_optimizers = [
-            (name, child)
-            for name, child in name_child_iterator
-            if not isinstance(child, Optimizer)
-        ]
-        optimizers = [
-            (name, child)
-            for name, child in name_child_iterator
-            if isinstance(child, Optimizer)
-        ]
+        not_optimizers, optimizers = [], []
+        for name, child in super().named_children():
+            if isinstance(child, Optimizer):
+                optimizers.append((name, child))
+            else:
+                not_optimizers.append((name, child))
 
-        yield from (not_optimizers + optimizers)
+        yield from not_optimizers
+        yield from optimizers
 
     def create_data(
         self, data, batch_size=32, steps_per_epoch=100, replace=False, **kwargs
@@ -464,6 +471,11 @@ class Application(DeeplayModule, L.LightningModule):
     def _apply_batch_transfer_handler(
         self, batch: Any, device: Optional[torch.device] = None, dataloader_idx: int = 0
     ) -> Any:
+        if isinstance(batch, (dict, Data)):
+            # Infer the batch size while the batch indices are still on the
+            # host, so that reading it does not synchronize with the device.
+            self._infer_batch_size_from_batch_indices(batch)
+
         batch = super()._apply_batch_transfer_handler(batch, device, dataloader_idx)
         return self._configure_batch(batch)
 
@@ -473,14 +485,15 @@ class Application(DeeplayModule, L.LightningModule):
                 "The batch should contain a 'y' key corresponding to the labels."
                 "Found {}".format([key for key, _ in batch.items()])
             )
-            self._infer_batch_size_from_batch_indices(batch)
             y = batch.pop("y")
             return batch, y
 
         return batch
 
     def _infer_batch_size_from_batch_indices(self, batch):
-        if not hasattr(self, "_batch_indices_key"):
+        # The key is resolved on the first batch and reused afterwards.
+        key = self._batch_indices_key
+        if key is None:
             alias = ["batch", "batch_index", "batch_indices"]
             key = next((key for key in alias if key in batch), None)
             if key:
@@ -491,15 +504,11 @@ class Application(DeeplayModule, L.LightningModule):
                     "Supported key names are {}".format(alias),
                 )
 
-        self._current_batch_size = (
-            torch.max(
-                batch[self._batch_indices_key],
-            ).item()
-            + 1
-        )
+        self._current_batch_size = int(batch[key].max()) + 1
 
     def log(self, name, value, **kwargs):
-        if (not "batch_size" in kwargs) and hasattr(self, "_current_batch_size"):
+        # log_dict always forwards batch_size, as None when not given.
+        if kwargs.get("batch_size") is None and self._current_batch_size is not None:
             kwargs.update({"batch_size": self._current_batch_size})
 
         super().log(name, value, **kwargs)
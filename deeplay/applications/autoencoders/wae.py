@@ -124,7 +124,7 @@ class WassersteinAutoEncoder(Application):
                 logger=True,
             )
 
-        return sum(loss.values())
+        return self._reduce_loss(loss)
 
     def compute_IMQ(self, x1, x2):
         # Inverse MultiQuadratic kernel
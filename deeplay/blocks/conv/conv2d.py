@@ -1,10 +1,14 @@
 from __future__ import annotations
 import warnings
-from typing import List, Optional, Type, Union, Literal
+from collections import Counter
+from functools import lru_cache
+from typing import List, Optional, Tuple, Type, Union, Literal
 from typing_extensions import Self
+import torch
 import torch.nn as nn
 
 from deeplay.blocks.base import BaseBlock
+from deeplay.decorators import after_build
 from deeplay.external import Layer
 from deeplay.module import DeeplayModule
 from deeplay.ops.logs import FromLogs
@@ -13,6 +17,16 @@ from deeplay.ops.shape import Permute
 from deeplay.blocks.base import DeferredConfigurableLayer
 from deeplay.shapes import Variable
 
+# Sets the channel-dependent arguments of each supported normalization layer.
+_NORMALIZATION_CONFIGURERS = {
+    nn.BatchNorm2d: lambda norm, channels: norm.configure(num_features=channels),
+    nn.GroupNorm: lambda norm, channels: norm.configure(
+        num_groups=norm.kwargs.get("num_groups", 1), num_channels=channels
+    ),
+    nn.InstanceNorm2d: lambda norm, channels: norm.configure(num_features=channels),
+    nn.LayerNorm: lambda norm, channels: norm.configure(normalized_shape=channels),
+}
+
 
 class Conv2dBlock(BaseBlock):
     """Convolutional block with optional normalization and activation."""
@@ -30,9 +44,15 @@ class Conv2dBlock(BaseBlock):
         kernel_size=3,
         stride=1,
         padding=0,
+        input_shape: Optional[Tuple[int, int, int]] = None,
         **kwargs,
     ):
 
+        # With a known (C, H, W) input shape, the convolution can be created
+        # eagerly instead of as a lazy layer.
+        if in_channels is None and input_shape is not None:
+            in_channels = input_shape[0]
+
         self.in_channels = in_channels
         self.out_channels = out_channels
         self.kernel_size = kernel_size
@@ -80,38 +100,40 @@ class Conv2dBlock(BaseBlock):
 
     def _configure_normalization(self):
 
-        idx = self.order.index("normalization")
         # if layer or blocks before normalization
-        if any(name in self.order[:idx] for name in ["layer", "blocks"]):
-            channels = self.out_channels
-        else:
-            channels = self.in_channels
+        has_layer_before = False
+        for name in self.order:
+            if name == "normalization":
+                break
+            if name in ("layer", "blocks"):
+                has_layer_before = True
+                break
+
+        channels = self.out_channels if has_layer_before else self.in_channels
 
         type: Type[nn.Module] = self.normalization.classtype
 
-        if type == nn.BatchNorm2d:
-            self.normalization.configure(num_features=channels)
-        elif type == nn.GroupNorm:
-            num_groups = self.normalization.kwargs.get("num_groups", 1)
-            self.normalization.configure(num_groups=num_groups, num_channels=channels)
-        elif type == nn.InstanceNorm2d:
-            self.normalization.configure(num_features=channels)
-        elif type == nn.LayerNorm:
-            self.normalization.configure(normalized_shape=channels)
-
-    def pooled(
-        self, pool: Layer = Layer(nn.MaxPool2d, 2, 2), mode="prepend", after=None
-    ) -> Self:
+        configure = _NORMALIZATION_CONFIGURERS.get(type)
+        if configure is not None:
+            configure(self.normalization, channels)
+
+    def pooled(self, pool: Optional[Layer] = None, mode="prepend", after=None) -> Self:
+        if pool is None:
+            pool = Layer(nn.MaxPool2d, 2, 2)
         self.set("pool", pool, mode=mode, after=after)
         return self
 
     def upsampled(
         self,
-        upsample: Layer = Layer(nn.ConvTranspose2d, kernel_size=2, stride=2, padding=0),
+        upsample: Optional[Layer] = None,
         mode="append",
         after=None,
     ) -> Self:
-        upsample = upsample.new()
+        if upsample is None:
+            upsample = Layer(nn.ConvTranspose2d, kernel_size=2, stride=2, padding=0)
+        else:
+            # Avoid configuring the layer passed by the user.
+            upsample = upsample.new()
         if "in_channels" in upsample.configurables:
             upsample.configure(in_channels=self.out_channels)
         if "out_channels" in upsample.configurables:
@@ -121,14 +143,14 @@ class Conv2dBlock(BaseBlock):
 
     def transposed(
         self,
-        transpose: Layer = Layer(
-            nn.ConvTranspose2d, kernel_size=2, stride=2, padding=0
-        ),
+        transpose: Optional[Layer] = None,
         mode="prepend",
         after=None,
         remove_upsample=True,
         remove_layer=True,
     ) -> Self:
+        if transpose is None:
+            transpose = Layer(nn.ConvTranspose2d, kernel_size=2, stride=2, padding=0)
         self.set("transpose", transpose, mode=mode, after=after)
         if remove_upsample:
             self.remove("upsample", allow_missing=True)
@@ -160,6 +182,15 @@ class Conv2dBlock(BaseBlock):
                 )
         return self
 
+    @after_build
+    def channels_last(self) -> Self:
+        """Store the parameters in channels-last memory format after build.
+
+        Channels-last convolutions map better onto tensor cores under
+        `torch.autocast`. Inputs should use the same memory format.
+        """
+        self.to(memory_format=torch.channels_last)
+
     def get_default_normalization(self) -> DeeplayModule:
         return Layer(nn.BatchNorm2d, self.out_channels)
 
@@ -167,26 +198,20 @@ class Conv2dBlock(BaseBlock):
         return Layer(nn.ReLU)
 
     def get_default_shortcut(self) -> DeeplayModule:
+        block = Conv2dBlock(
+            in_channels=self.in_channels,
+            out_channels=self.out_channels,
+            kernel_size=1,
+            stride=self.stride,
+            padding=0,
+        )
         if self.in_channels == self.out_channels and (
             self.stride == 1 or self.in_channels is None
         ):
-            block = Conv2dBlock(
-                in_channels=self.in_channels,
-                out_channels=self.out_channels,
-                kernel_size=1,
-                stride=self.stride,
-                padding=0,
-            )
+            # The identity shortcut stays a Conv2dBlock so that it can later
+            # become a projection (e.g. through `strided` or `normalized`).
             block.configure("layer", nn.Identity)
-            return block
-        else:
-            return Conv2dBlock(
-                in_channels=self.in_channels,
-                out_channels=self.out_channels,
-                kernel_size=1,
-                stride=self.stride,
-                padding=0,
-            )
+        return block
 
     def get_default_merge(self) -> MergeOp:
         return Add()
@@ -201,30 +226,21 @@ class Conv2dBlock(BaseBlock):
         return True
 
 
-@Conv2dBlock.register_style
-def residual(
-    block: Conv2dBlock,
-    order: str = "lanlan|",
-    activation: Union[Type[nn.Module], Layer] = nn.ReLU,
-    normalization: Union[Type[nn.Module], Layer] = nn.BatchNorm2d,
-    dropout: float = 0.1,
-):
-    """Make a residual block with the given order of layers.
+_RESIDUAL_LETTER_NAMES = {
+    "l": "layer",
+    "a": "activation",
+    "n": "normalization",
+    "d": "dropout",
+}
 
-    Parameters
-    ----------
-    order : str
-        The order of layers in the residual block. The shorthand is a string of 'l', 'a', 'n', 'd' and '|'.
-        'l' stands for layer, 'a' stands for activation, 'n' stands for normalization, 'd' stands for dropout,
-        and '|' stands for the skip connection. The order of the characters in the string determines the order
-        of the layers in the residual block. The characters after the '|' determine the order of the layers after
-        the skip connection.
-    activation : Union[Type[nn.Module], Layer]
-        The activation function to use in the residual block.
-    normalization : Union[Type[nn.Module], Layer]
-        The normalization layer to use in the residual block.
-    dropout : float
-        The dropout rate to use in the residual block.
+
+@lru_cache(maxsize=32)
+def _parse_residual_order(order: str) -> Tuple[Tuple[Tuple[str, ...], ...], str]:
+    """Validate a residual order shorthand and split it into block orders.
+
+    Returns the layer names of each block before the skip connection and the
+    letters that follow it. Cached since deep residual networks build many
+    blocks from the same shorthand.
     """
     order = order.lower()
     if "|" not in order:
@@ -234,28 +250,21 @@ def residual(
         c in "land|" for c in order
     ), f"The residual order shorthand must only contain the characters 'l', 'a', 'n', 'd' and '|'. Received: {order}"
 
-    after_skip_order = order[order.index("|") + 1 :]
+    skip_index = order.index("|")
+    after_skip_order = order[skip_index + 1 :]
     assert all(
         c in "and" for c in after_skip_order
     ), f"The residual order shorthand must only contain the characters 'a', 'n', 'd' after the skip connection. Received: {order}"
 
-    letter_count_map = {c: after_skip_order.count(c) for c in "lan"}
+    letter_counts = Counter(after_skip_order)
     assert all(
-        count <= 1 for count in letter_count_map.values()
+        letter_counts[c] <= 1 for c in "lan"
     ), f"The residual order shorthand must contain at most one of each of the characters 'l', 'a', 'n' after the skip connection. Received: {order}"
 
     block_orders = []
     _order = []
-    for c in order[: order.index("|")]:
-        if c == "l":
-            _name = "layer"
-        elif c == "a":
-            _name = "activation"
-        elif c == "n":
-            _name = "normalization"
-        elif c == "d":
-            _name = "dropout"
-
+    for c in order[:skip_index]:
+        _name = _RESIDUAL_LETTER_NAMES[c]
         if _name in _order:
             block_orders.append(_order)
             _order = []
@@ -264,6 +273,37 @@ def residual(
 
     if _order:
         block_orders.append(_order)
+
+    return tuple(tuple(names) for names in block_orders), after_skip_order
+
+
+@Conv2dBlock.register_style
+def residual(
+    block: Conv2dBlock,
+    order: str = "lanlan|",
+    activation: Union[Type[nn.Module], Layer] = nn.ReLU,
+    normalization: Union[Type[nn.Module], Layer] = nn.BatchNorm2d,
+    dropout: float = 0.1,
+):
+    """Make a residual block with the given order of layers.
+
+    Parameters
+    ----------
+    order : str
+        The order of layers in the residual block. The shorthand is a string of 'l', 'a', 'n', 'd' and '|'.
+        'l' stands for layer, 'a' stands for activation, 'n' stands for normalization, 'd' stands for dropout,
+        and '|' stands for the skip connection. The order of the characters in the string determines the order
+        of the layers in the residual block. The characters after the '|' determine the order of the layers after
+        the skip connection.
+    activation : Union[Type[nn.Module], Layer]
+        The activation function to use in the residual block.
+    normalization : Union[Type[nn.Module], Layer]
+        The normalization layer to use in the residual block.
+    dropout : float
+        The dropout rate to use in the residual block.
+    """
+    block_orders, after_skip_order = _parse_residual_order(order)
+
     ksize = block.kernel_size
     if isinstance(ksize, tuple):
         padding = tuple(k // 2 for k in ksize)
@@ -280,7 +320,7 @@ def residual(
             block.blocks[i].normalized(normalization)
         if "dropout" in block_order:
             block.blocks[i].set_dropout(dropout)
-        block.blocks[i].configure(order=block_order)
+        block.blocks[i].configure(order=list(block_order))
 
     for i, letter in enumerate(after_skip_order):
         if letter == "a":
@@ -17,12 +17,13 @@ class Conv2dBlock(BaseBlock):
     kernel_size: Incomplete
     stride: Incomplete
     padding: Incomplete
-    def __init__(self, in_channels: int | None, out_channels: int, kernel_size: int = 3, stride: int = 1, padding: int = 0, **kwargs) -> None: ...
+    def __init__(self, in_channels: int | None, out_channels: int, kernel_size: int = 3, stride: int = 1, padding: int = 0, input_shape: tuple[int, int, int] | None = None, **kwargs) -> None: ...
     def normalized(self, normalization: Type[nn.Module] | DeeplayModule = ..., mode: str = 'append', after: Incomplete | None = None) -> Self: ...
-    def pooled(self, pool: Layer = ..., mode: str = 'prepend', after: Incomplete | None = None) -> Self: ...
-    def upsampled(self, upsample: Layer = ..., mode: str = 'append', after: Incomplete | None = None) -> Self: ...
-    def transposed(self, transpose: Layer = ..., mode: str = 'prepend', after: Incomplete | None = None, remove_upsample: bool = True, remove_layer: bool = True) -> Self: ...
+    def pooled(self, pool: Layer | None = None, mode: str = 'prepend', after: Incomplete | None = None) -> Self: ...
+    def upsampled(self, upsample: Layer | None = None, mode: str = 'append', after: Incomplete | None = None) -> Self: ...
+    def transposed(self, transpose: Layer | None = None, mode: str = 'prepend', after: Incomplete | None = None, remove_upsample: bool = True, remove_layer: bool = True) -> Self: ...
     def strided(self, stride: int | tuple[int, ...], remove_pool: bool = True) -> Self: ...
+    def channels_last(self) -> Self: ...
     def multi(self, n: int = 1) -> Self: ...
     def shortcut(self, merge: MergeOp = ..., shortcut: Literal['auto'] | Type[nn.Module] | DeeplayModule | None = 'auto') -> Self: ...
     @overload
@@ -267,7 +267,7 @@ class ConvolutionalDecoder2d(ConvolutionalNeuralNetwork):
 
     def upsampled(
         self,
-        upsample: Layer = Layer(nn.ConvTranspose2d, kernel_size=2, stride=2, padding=0),
+        upsample: Optional[Layer] = None,
         apply_to_last_layer: bool = False,
         mode="append",
         after=None,
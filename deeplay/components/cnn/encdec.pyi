@@ -45,7 +45,7 @@ class ConvolutionalDecoder2d(ConvolutionalNeuralNetwork):
     preprocess: Incomplete
     def __init__(self, in_channels: int | None, hidden_channels: Sequence[int], out_channels: int, out_activation: Type[nn.Module] | nn.Module | None | None = None, preprocess: Type[nn.Module] | nn.Module = None) -> None: ...
     def forward(self, x): ...
-    def upsampled(self, upsample: Layer = ..., apply_to_last_layer: bool = False, mode: str = 'append', after: Incomplete | None = None): ...
+    def upsampled(self, upsample: Layer | None = None, apply_to_last_layer: bool = False, mode: str = 'append', after: Incomplete | None = None): ...
     @overload
     def configure(self, in_channels: int | None = None, hidden_channels: List[int] | None = None, out_channels: int | None = None, out_activation: Type[nn.Module] | nn.Module | None = None) -> None: ...
     @overload
@@ -1,9 +1,11 @@
+import math
 from typing import List, Optional, Literal, Any, Sequence, Type, overload, Union
 
 from deeplay.blocks.linear.linear import LinearBlock
 
 from deeplay import DeeplayModule, Layer, LayerList
 
+import torch
 import torch.nn as nn
 
 
@@ -15,7 +17,7 @@ class MultiLayerPerceptron(DeeplayModule):
     Configurables
     -------------
 
-    - in_features (int): Number of input features. If None, the input shape is inferred in the first forward pass. (Default: None)
+    - in_features (int): Number of input features. If None, the input shape is inferred from `input_shape`, or else in the first forward pass. (Default: None)
     - hidden_features (list[int]): Number of hidden units in each layer.
     - out_features (int): Number of output features. (Default: 1)
     - blocks (template-like): Specification for the blocks of the MLP. (Default: "layer" >> "activation" >> "normalization" >> "dropout")
@@ -23,6 +25,9 @@ class MultiLayerPerceptron(DeeplayModule):
         - activation (template-like): Specification for the activation of the block. (Default: nn.ReLU)
         - normalization (template-like): Specification for the normalization of the block. (Default: nn.Identity)
     - out_activation (template-like): Specification for the output activation of the MLP. (Default: nn.Identity)
+    - compile_blocks (bool): Whether to compile the blocks with `torch.compile(mode="reduce-overhead")`. (Default: False)
+    - input_shape (tuple[int, ...]): Shape of a single input sample, without the batch dimension. Used to set `in_features` when it is None. (Default: None)
+    - param_dtype (torch.dtype): Data type to cast the parameters to after build, e.g. `torch.bfloat16`. Run the model under `torch.autocast` so that inputs match. (Default: None)
 
     Shorthands
     ----------
@@ -102,13 +107,24 @@ class MultiLayerPerceptron(DeeplayModule):
         out_features: int,
         out_activation: Union[Type[nn.Module], nn.Module, None] = None,
         flatten_input: bool = True,
+        compile_blocks: bool = False,
+        param_dtype: Optional[torch.dtype] = None,
+        input_shape: Optional[Sequence[int]] = None,
     ):
         super().__init__()
 
+        # Resolve the input size eagerly when the shape of a sample is known,
+        # so the first layer does not need to be lazy.
+        if in_features is None and input_shape is not None:
+            in_features = math.prod(input_shape) if flatten_input else input_shape[-1]
+
         self.in_features = in_features
         self.hidden_features = hidden_features
         self.out_features = out_features
         self.flatten_input = flatten_input
+        self.compile_blocks = compile_blocks
+        self.param_dtype = param_dtype
+        self.input_shape = input_shape
 
         if out_features <= 0:
             raise ValueError(
@@ -134,7 +150,7 @@ class MultiLayerPerceptron(DeeplayModule):
             prev = out_activation
             out_activation = Layer(lambda: prev)
 
-        f_out = in_features
+        output_index = len(hidden_features)
 
         self.blocks = LayerList()
         for i, (f_in, f_out) in enumerate(
@@ -146,15 +162,35 @@ class MultiLayerPerceptron(DeeplayModule):
                     f_in,
                     f_out,
                     activation=(
-                        out_activation.new()
-                        if i == len(hidden_features)
-                        else Layer(nn.ReLU)
+                        out_activation.new() if i == output_index else Layer(nn.ReLU)
                     ),
                 )
             )
 
+        # Compiling the blocks fuses the bias, activation and dropout kernels
+        # of each block. "reduce-overhead" additionally replays the many small
+        # kernels of the MLP as a CUDA graph.
+        self._compiled_forward_blocks = (
+            torch.compile(self._forward_blocks, mode="reduce-overhead")
+            if compile_blocks
+            else None
+        )
+
+    def build(self, *args, **kwargs):
+        super().build(*args, **kwargs)
+        # Cast once the layers exist, using the dtype configured at build time.
+        if self.param_dtype is not None:
+            self.to(self.param_dtype)
+        return self
+
     def forward(self, x):
-        x = nn.Flatten()(x) if self.flatten_input else x
+        if self.flatten_input and x.dim() > 2:
+            x = x.flatten(1)
+        if self._compiled_forward_blocks is not None:
+            return self._compiled_forward_blocks(x)
+        return self._forward_blocks(x)
+
+    def _forward_blocks(self, x):
         for block in self.blocks:
             x = block(x)
         return x
@@ -167,6 +203,9 @@ class MultiLayerPerceptron(DeeplayModule):
         hidden_features: Optional[List[int]] = None,
         out_features: Optional[int] = None,
         out_activation: Union[Type[nn.Module], nn.Module, None] = None,
+        compile_blocks: Optional[bool] = None,
+        param_dtype: Optional[torch.dtype] = None,
+        input_shape: Optional[Sequence[int]] = None,
     ) -> None: ...
 
     @overload
@@ -1,4 +1,5 @@
 from typing import Literal, Type, Union, Optional, overload
+import torch
 import torch.nn as nn
 from _typeshed import Incomplete
 from deeplay import DeeplayModule as DeeplayModule, Layer as Layer, LayerList as LayerList
@@ -25,10 +26,13 @@ class MultiLayerPerceptron(DeeplayModule):
     @property
     def dropout(self) -> LayerList[Layer]: ...
     flatten_input: Incomplete
-    def __init__(self, in_features: int | None, hidden_features: Sequence[int | None], out_features: int, out_activation: Type[nn.Module] | nn.Module | None = None, flatten_input: bool = True) -> None: ...
+    compile_blocks: Incomplete
+    param_dtype: Incomplete
+    input_shape: Incomplete
+    def __init__(self, in_features: int | None, hidden_features: Sequence[int | None], out_features: int, out_activation: Type[nn.Module] | nn.Module | None = None, flatten_input: bool = True, compile_blocks: bool = False, param_dtype: torch.dtype | None = None, input_shape: Sequence[int] | None = None) -> None: ...
     def forward(self, x): ...
     @overload
-    def configure(self, in_features: int | None = None, hidden_features: List[int] | None = None, out_features: int | None = None, out_activation: Type[nn.Module] | nn.Module | None = None) -> None: ...
+    def configure(self, in_features: int | None = None, hidden_features: List[int] | None = None, out_features: int | None = None, out_activation: Type[nn.Module] | nn.Module | None = None, compile_blocks: bool | None = None, param_dtype: torch.dtype | None = None, input_shape: Sequence[int] | None = None) -> None: ...
     @overload
     def configure(self, name: Literal['blocks'], index: int | slice | List[int | slice] | None = None, order: Sequence[str] | None = None, layer: Type[nn.Module] | None = None, activation: Type[nn.Module] | None = None, normalization: Type[nn.Module] | None = None, **kwargs: Any) -> None: ...
     @overload
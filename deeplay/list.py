@@ -1,4 +1,4 @@
-from typing import Any, overload, Iterator, List, Generic, TypeVar, Union, Tuple, Dict
+from typing import Any, overload, Iterable, Iterator, List, Generic, TypeVar, Union, Tuple, Dict
 
 import torch
 from torch import nn
@@ -15,57 +15,65 @@ T = TypeVar("T", bound=nn.Module)
 class LayerList(DeeplayModule, nn.ModuleList, Generic[T]):
     def __pre_init__(self, *layers: Union[T, List[T]], _args: Tuple[T, ...] = ()):
         if len(layers) == 1 and isinstance(layers[0], list):
-            input_layers: Tuple[T] = layers[0]
-        else:
-            input_layers: tuple[T] = layers
-        layers = tuple(input_layers) + _args
-        super().__pre_init__(_args=layers)
+            layers = tuple(layers[0])
+        super().__pre_init__(_args=layers + _args)
 
     def __init__(self, *layers: T):
         super().__init__()
 
-        while len(self):
-            super().pop(0)
+        self._modules.clear()
 
         for idx, layer in enumerate(layers):
-            super().append(layer)
-            if isinstance(layer, DeeplayModule) and not layer._has_built:
-                should_rebuild = self._give_user_configuration(layer, self._get_abs_string_index(idx))
-                if should_rebuild:
-                    layer.__construct__()
+            self.add_module(str(idx), layer)
+            self._adopt(layer, str(idx))
+
+    def _adopt(self, module: nn.Module, name: str):
+        # Hand the user configuration to a newly added child. The child is
+        # only reconstructed if that actually gave it new configuration;
+        # modules that were already adopted or built are left as they are.
+        if isinstance(module, DeeplayModule) and not module._has_built:
+            if self._give_user_configuration(module, name):
+                module.__construct__()
 
     @after_init
     def append(self, module: DeeplayModule) -> "LayerList[T]":
         super(LayerList, self).append(module)
-        if isinstance(module, DeeplayModule) and not module._has_built:
-            should_rebuild = self._give_user_configuration(module, self._get_abs_string_index(-1))
-            if should_rebuild:
-                module.__construct__()
+        self._adopt(module, self._get_abs_string_index(-1))
         return self
 
-    @after_init
     def pop(self, key: int = -1) -> T:
-        return super().pop(key)
+        # after_init methods return self, so the removal is recorded through
+        # _pop and the popped layer is captured here.
+        popped = self[key]
+        self._pop(key)
+        return popped
+
+    @after_init
+    def _pop(self, key: int = -1):
+        super().pop(key)
 
     @after_init
     def insert(self, index: int, module: DeeplayModule) -> "LayerList[T]":
         super().insert(index, module)
-        if isinstance(module, DeeplayModule) and not module._has_built:
-            should_rebuild = self._give_user_configuration(module, self._get_abs_string_index(index))
-            if should_rebuild: 
-                module.__construct__()
+        self._adopt(module, self._get_abs_string_index(index))
         return self
 
+    def extend(self, modules: Iterable[DeeplayModule]) -> "LayerList[T]":
+        """Append all modules at once.
+
+        Prefer this over repeated `append` calls when adding many layers, since
+        it is recorded (and replayed on reconstruction) as a single operation.
+        """
+        # Materialize the modules so that the call can be replayed even if
+        # `modules` is a one-shot iterator.
+        return self._extend(list(modules))
+
     @after_init
-    def extend(self, modules: List[DeeplayModule]) -> "LayerList[T]":
+    def _extend(self, modules: List[DeeplayModule]) -> "LayerList[T]":
+        start = len(self)
         super().extend(modules)
-        for idx, module in enumerate(modules):
-            if isinstance(module, DeeplayModule) and not module._has_built:
-                should_rebuild = self._give_user_configuration(
-                    module, self._get_abs_string_index(idx + len(self) - len(modules))
-                )
-                if should_rebuild:
-                    module.__construct__()
+        for idx, module in enumerate(modules, start):
+            self._adopt(module, str(idx))
         return self
 
     @after_init
@@ -82,21 +90,30 @@ class LayerList(DeeplayModule, nn.ModuleList, Generic[T]):
     def configure(self, name: str, *args: Any, **kwargs: Any) -> None: ...
 
     def configure(self, *args, **kwargs):
-        if len(args) > 0:
-            if isinstance(args[0], int):
-                self[args[0]].configure(*args[1:], **kwargs)
-            elif isinstance(args[0], slice):
-                for layer in self[args[0]]:
-                    layer.configure(*args[1:], **kwargs)
-            elif isinstance(args[0], list):
-                for arg in args[0]:
-                    self.configure(arg, *args[1:], **kwargs)
-            else:
-                for layer in self:
-                    layer.configure(*args, **kwargs)
-
+        selector = args[0] if args else None
+        if isinstance(selector, int):
+            self[selector].configure(*args[1:], **kwargs)
+        elif isinstance(selector, slice):
+            # Index the children directly instead of building a
+            # ReferringLayerList for the slice.
+            for layer in list(self._modules.values())[selector]:
+                layer.configure(*args[1:], **kwargs)
+        elif isinstance(selector, list):
+            # Resolve all entries up front so that each layer is configured
+            # once, even if the entries repeat or overlap.
+            positions = range(len(self))
+            indices = {}
+            for entry in selector:
+                if isinstance(entry, slice):
+                    indices.update(dict.fromkeys(positions[entry]))
+                else:
+                    indices[positions[entry]] = None
+            layers = list(self._modules.values())
+            for idx in indices:
+                layers[idx].configure(*args[1:], **kwargs)
         else:
-            for layer in self:
+            # Broadcast to all layers.
+            for layer in self._modules.values():
                 layer.configure(*args, **kwargs)
 
     def set_input_map(self, *args: str, **kwargs: str):
@@ -108,7 +125,7 @@ class LayerList(DeeplayModule, nn.ModuleList, Generic[T]):
             layer.set_output_map(*args, **kwargs)
 
     def __iter__(self) -> Iterator[T]:
-        return super().__iter__()  # type: ignore
+        return iter(self._modules.values())  # type: ignore
 
     def __getattr__(self, name: str) -> "ReferringLayerList[T]":
         try:
@@ -151,12 +168,13 @@ class LayerList(DeeplayModule, nn.ModuleList, Generic[T]):
 
     def __getitem__(self, index: Union[int, slice, tuple]) -> "Union[T, LayerList[T], Selection, ReferringLayerList]":
         if isinstance(index, int):
-            return getattr(self, self._get_abs_string_index(index))
+            # Look up the child directly rather than through getattr, which
+            # only reaches _modules after the regular attribute lookup fails.
+            return self._modules[self._get_abs_string_index(index)]
         elif isinstance(index, tuple):
             return DeeplayModule.__getitem__(self, index)
         else:
-            indices = list(range(len(self)))[index]
-            return ReferringLayerList(*[self[idx] for idx in indices])
+            return ReferringLayerList(*list(self._modules.values())[index])
 
     def __add__(self, other: "LayerList[T]") -> "ReferringLayerList[T]":
         return ReferringLayerList(*self, *other)
@@ -204,6 +222,71 @@ class ReferringLayerList(list, Generic[T]):
 
 
 class Sequential(LayerList, Generic[T]):
+    def scripted(self) -> torch.jit.ScriptModule:
+        """Return a TorchScript compiled version of the sequence.
+
+        The layers are scripted as a plain `nn.Sequential`, which shares its
+        parameters with this module. The result is cached until the layers
+        change. Calling the module itself still runs eagerly.
+        """
+        if not self._has_built:
+            raise RuntimeError(
+                "Sequential must be built before it can be scripted. Call .build() first."
+            )
+        layers = tuple(self)
+        cached = self.__dict__.get("_scripted")
+        if cached is None or cached[0] != layers:
+            # Stored outside of _modules so it is not registered as a child.
+            cached = (layers, torch.jit.script(nn.Sequential(*layers)))
+            self.__dict__["_scripted"] = cached
+        return cached[1]
+
+    def capture_cuda_graph(self, example_input: torch.Tensor) -> nn.Module:
+        """Return a version of the sequence that replays a captured CUDA graph.
+
+        The layers are captured as a plain `nn.Sequential` sharing parameters
+        with this module, using `torch.cuda.make_graphed_callables`. The graph
+        is only valid for inputs with the same shape, dtype and device as
+        `example_input`, and must be captured again if the layers change.
+        Calling the module itself still runs eagerly.
+        """
+        if not self._has_built:
+            raise RuntimeError(
+                "Sequential must be built before it can be captured. Call .build() first."
+            )
+        if not example_input.is_cuda:
+            raise ValueError(
+                f"CUDA graph capture requires a CUDA input. Got a tensor on {example_input.device} instead."
+            )
+        return torch.cuda.make_graphed_callables(nn.Sequential(*self), (example_input,))
+
+    def flatten(self) -> "Sequential[T]":
+        """Return a Sequential with nested Sequentials expanded in place.
+
+        The module must be built. The result is built as well and shares its
+        layers with this module, so `model.flatten().scripted()` scripts a
+        single flat sequence. Nested Sequentials with an input or output map
+        are kept as they are, since expanding them would change what gets
+        passed between layers.
+        """
+        if not self._has_built:
+            # Unbuilt layers would be adopted by the new container, which
+            # would then record their configuration instead of this module.
+            raise RuntimeError(
+                "Sequential must be built before it can be flattened. Call .build() first."
+            )
+        return Sequential(*self._flat_layers()).build()
+
+    def _flat_layers(self) -> Iterator[nn.Module]:
+        for layer in self:
+            if isinstance(layer, Sequential) and not (
+                getattr(layer, "_input_mapped", False)
+                or getattr(layer, "_output_mapped", False)
+            ):
+                yield from layer._flat_layers()
+            else:
+                yield layer
+
     def forward(self, x):
         for layer in self:
             x = layer(x)
@@ -13,24 +13,28 @@ def normed_leaky(mlp: MultiLayerPerceptron):
 
 
 class SmallMLP(MultiLayerPerceptron):
-    def __init__(self, in_features, out_features):
-        super().__init__(in_features, [32, 32], out_features)
+    def __init__(self, in_features, out_features, param_dtype=None):
+        super().__init__(in_features, [32, 32], out_features, param_dtype=param_dtype)
         self.style("normed_leaky")
 
 
 class MediumMLP(MultiLayerPerceptron):
-    def __init__(self, in_features, out_features):
-        super().__init__(in_features, [64, 128], out_features)
+    def __init__(self, in_features, out_features, param_dtype=None):
+        super().__init__(in_features, [64, 128], out_features, param_dtype=param_dtype)
         self.style("normed_leaky")
 
 
 class LargeMLP(MultiLayerPerceptron):
-    def __init__(self, in_features, out_features):
-        super().__init__(in_features, [128, 128, 128], out_features)
+    def __init__(self, in_features, out_features, param_dtype=None):
+        super().__init__(
+            in_features, [128, 128, 128], out_features, param_dtype=param_dtype
+        )
         self.style("normed_leaky")
 
 
 class XLargeMLP(MultiLayerPerceptron):
-    def __init__(self, in_features, out_features):
-        super().__init__(in_features, [128, 256, 512, 512], out_features)
+    def __init__(self, in_features, out_features, param_dtype=None):
+        super().__init__(
+            in_features, [128, 256, 512, 512], out_features, param_dtype=param_dtype
+        )
         self.style("normed_leaky")
@@ -123,6 +123,17 @@ class BaseApplicationTest:
                     for c_p, b_p in zip(c.parameters(), b.parameters()):
                         self.assertEqual(c_p.shape, b_p.shape)
 
+        def test_metrics_are_not_shared_between_collections(self):
+            for network in self.get_networks():
+                created = network.create()
+                train_ids = {id(m) for m in created.train_metrics.values()}
+                val_ids = {id(m) for m in created.val_metrics.values()}
+                test_ids = {id(m) for m in created.test_metrics.values()}
+
+                self.assertFalse(train_ids & val_ids)
+                self.assertFalse(train_ids & test_ids)
+                self.assertFalse(val_ids & test_ids)
+
         def test_can_configure_optimizer(self):
             for network in self.get_networks():
                 network.configure(optimizer=Adam(lr=1))
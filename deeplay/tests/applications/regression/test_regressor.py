@@ -1,8 +1,11 @@
 from deeplay.components.mlp import MultiLayerPerceptron
 from ..base import BaseApplicationTest
 from deeplay.applications.regression.regressor import Regressor
+import lightning as L
 import torch
 import torch.nn
+import torchmetrics as tm
+from unittest.mock import patch
 
 
 class TestRegressor(BaseApplicationTest.BaseTest):
@@ -30,3 +33,52 @@ class TestRegressor(BaseApplicationTest.BaseTest):
             self.assertEqual(y_pred.shape, y.shape)
             self.assertIsInstance(y_pred, torch.Tensor)
             self.assertIsInstance(y, torch.Tensor)
+
+    def test_dict_batch_infers_batch_size(self):
+        network = self.get_networks()[0].create()
+        batch = {
+            "x": torch.randn(5, 1),
+            "batch_index": torch.tensor([0, 0, 1, 2, 2]),
+            "y": torch.randn(3, 1),
+        }
+
+        x, y = network._apply_batch_transfer_handler(batch, torch.device("cpu"))
+
+        self.assertEqual(network._current_batch_size, 3)
+        self.assertNotIn("y", x)
+        self.assertEqual(y.shape, (3, 1))
+
+    def test_inferred_batch_size_reaches_log(self):
+        network = self.get_networks()[0].create()
+        network._current_batch_size = 3
+
+        with patch.object(L.LightningModule, "log") as log:
+            network.log_dict({"train_loss": torch.tensor(1.0)})
+            network.log("val_loss", torch.tensor(1.0))
+            network.log("test_loss", torch.tensor(1.0), batch_size=5)
+
+        batch_sizes = [call.kwargs["batch_size"] for call in log.call_args_list]
+        self.assertEqual(batch_sizes, [3, 3, 5])
+
+    def test_log_metrics_uses_reassigned_collection(self):
+        network = Regressor(
+            MultiLayerPerceptron(1, [1], 1), metrics=[tm.MeanAbsoluteError()]
+        )
+        network.val_metrics = tm.MetricCollection([tm.MeanSquaredError()], prefix="val")
+        network = network.create()
+
+        with patch.object(L.LightningModule, "log") as log:
+            network.log_metrics("val", torch.randn(4, 1), torch.randn(4, 1))
+
+        logged = [call.args[0] for call in log.call_args_list]
+        self.assertEqual(logged, ["valMeanSquaredError"])
+
+    def test_reduce_multi_term_loss(self):
+        a, b = torch.tensor(1.0), torch.tensor(2.0)
+        self.assertEqual(Regressor._reduce_loss({"a": a, "b": b}).item(), 3.0)
+
+        # Plain numbers and non-scalar terms are summed like before.
+        loss = Regressor._reduce_loss({"a": a, "b": 0})
+        self.assertEqual(loss.item(), 1.0)
+        loss = Regressor._reduce_loss({"a": a, "b": torch.ones(2)})
+        self.assertTrue(torch.equal(loss, torch.tensor([2.0, 2.0])))
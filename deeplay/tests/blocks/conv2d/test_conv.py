@@ -249,3 +249,16 @@ class TestConv2dBlock(unittest.TestCase):
         x = torch.randn(1, 1, 4, 4)
         output = block(x)
         self.assertEqual(output.shape, x.shape)
+
+    def test_channels_last(self):
+        block = Conv2dBlock(in_channels=2, out_channels=4).channels_last().build()
+        self.assertTrue(
+            block.layer.weight.is_contiguous(memory_format=torch.channels_last)
+        )
+
+    def test_input_shape(self):
+        block = Conv2dBlock(in_channels=None, out_channels=4, input_shape=(2, 8, 8))
+        block.build()
+        self.assertEqual(block.in_channels, 2)
+        self.assertEqual(type(block.layer), nn.Conv2d)
+        self.assertEqual(block.layer.in_channels, 2)
@@ -10,6 +10,7 @@ from deeplay import (
     Parallel,
 )
 import itertools
+import pickle
 
 from deeplay.blocks.conv.conv2d import Conv2dBlock
 from deeplay.list import ReferringLayerList
@@ -81,6 +82,14 @@ class TestLayerList(unittest.TestCase):
             self.assertEqual(len(module.layers), 5, Wrapper)
             self.assertEqual(module.layers[0].in_features, 2, Wrapper)
 
+    def test_configure_list_of_indices(self):
+        for Wrapper in [Wrapper1, Wrapper2, Wrapper3]:
+            module = Wrapper(5)
+            module.layers.configure([0, slice(0, 2), -1, 4], out_features=7)
+            module.build()
+            out_features = [layer.out_features for layer in module.layers]
+            self.assertEqual(out_features, [7, 7, 4, 5, 7], Wrapper)
+
     def test_index_slice(self):
         for Wrapper in [Wrapper1, Wrapper2, Wrapper3]:
             module = Wrapper(5)
@@ -222,6 +231,15 @@ class TestLayerList(unittest.TestCase):
         llist.build()
         self.assertEqual(len(llist.layers), 5)
 
+    def test_layer_list_extend_generator_after_init(self):
+        llist = Wrapper1(3)
+        llist.layers.extend(Layer(nn.Linear, 1, 1) for _ in range(2))
+        self.assertEqual(len(llist.layers), 5)
+        llist.configure(n_layers=2)
+        self.assertEqual(len(llist.layers), 4)
+        llist.build()
+        self.assertEqual(len(llist.layers), 4)
+
     def test_layer_list_insert_after_init(self):
         llist = Wrapper1(3)
         llist.layers.insert(1, Layer(nn.Tanh))
@@ -233,7 +251,8 @@ class TestLayerList(unittest.TestCase):
 
     def test_layer_list_pop_after_init(self):
         llist = Wrapper1(3)
-        llist.layers.pop()
+        last = llist.layers[-1]
+        self.assertIs(llist.layers.pop(), last)
         self.assertEqual(len(llist.layers), 2)
         llist.build()
         self.assertEqual(len(llist.layers), 2)
@@ -339,6 +358,91 @@ class TestLayerList(unittest.TestCase):
 
 
 class TestSequential(unittest.TestCase):
+    def test_scripted(self):
+        model = Sequential(
+            Layer(nn.Linear, 2, 3),
+            Layer(nn.ReLU),
+            Layer(nn.Linear, 3, 1),
+        ).build()
+
+        scripted = model.scripted()
+        self.assertIsInstance(scripted, torch.jit.ScriptModule)
+        self.assertIs(model.scripted(), scripted)
+        self.assertEqual(len(model), 3)
+
+        x = torch.randn(4, 2)
+        self.assertTrue(torch.allclose(scripted(x), model(x)))
+
+    def test_scripted_requires_build(self):
+        model = Sequential(Layer(nn.Linear, 2, 3))
+        with self.assertRaises(RuntimeError):
+            model.scripted()
+
+    def test_capture_cuda_graph_requires_cuda_input(self):
+        model = Sequential(Layer(nn.Linear, 2, 3)).build()
+        with self.assertRaises(ValueError):
+            model.capture_cuda_graph(torch.randn(4, 2))
+
+    @unittest.skipUnless(torch.cuda.is_available(), "CUDA is not available")
+    def test_capture_cuda_graph(self):
+        model = Sequential(
+            Layer(nn.Linear, 2, 3),
+            Layer(nn.ReLU),
+            Layer(nn.Linear, 3, 1),
+        ).build()
+        model.cuda()
+
+        x = torch.randn(4, 2, device="cuda")
+        graphed = model.capture_cuda_graph(x)
+        self.assertTrue(torch.allclose(graphed(x), model(x)))
+
+    def test_flatten(self):
+        model = Sequential(
+            Layer(nn.Linear, 2, 3),
+            Sequential(Layer(nn.ReLU), Sequential(Layer(nn.Linear, 3, 3))),
+            Layer(nn.Linear, 3, 1),
+        ).build()
+
+        flat = model.flatten()
+        self.assertEqual(len(flat), 4)
+        self.assertTrue(flat._has_built)
+        self.assertFalse(any(isinstance(layer, Sequential) for layer in flat))
+        self.assertIs(flat[1], model[1][0])
+
+        x = torch.randn(4, 2)
+        self.assertTrue(torch.allclose(flat(x), model(x)))
+        self.assertTrue(torch.allclose(flat.scripted()(x), model(x)))
+
+    def test_flatten_keeps_original_intact(self):
+        model = Sequential(
+            Layer(nn.Linear, 2, 3),
+            Sequential(Layer(nn.ReLU), Layer(nn.Linear, 3, 1)),
+        )
+        with self.assertRaises(RuntimeError):
+            model.flatten()
+
+        model[0].configure(out_features=5)
+        model[1][1].configure(in_features=5)
+        model.build()
+        model.flatten()
+
+        restored = pickle.loads(pickle.dumps(model))
+        self.assertEqual(restored[0].out_features, 5)
+        x = torch.randn(4, 2)
+        self.assertTrue(torch.allclose(restored(x), model(x)))
+
+    def test_compile(self):
+        model = Sequential(
+            Layer(nn.Linear, 2, 3),
+            Layer(nn.ReLU),
+            Layer(nn.Linear, 3, 1),
+        ).build()
+
+        x = torch.randn(4, 2)
+        expected = model(x)
+        model.compile(dynamic=False)
+        self.assertTrue(torch.allclose(model(x), expected))
+
     def test_set_inp_out_mapping_1(self):
         model = Sequential(
             Layer(nn.Linear, 1, 20),
@@ -114,3 +114,46 @@ class TestComponentMLP(unittest.TestCase):
         self.assertEqual(len(mlp.blocks), 1)
         self.assertEqual(mlp.blocks[0].layer.in_features, 0)
         self.assertEqual(mlp.blocks[0].layer.out_features, 3)
+
+    def test_compile_blocks(self):
+        mlp = MultiLayerPerceptron(2, [4], 3).build()
+        compiled = MultiLayerPerceptron(2, [4], 3, compile_blocks=True).build()
+        compiled.load_state_dict(mlp.state_dict())
+
+        x = torch.randn(2, 2)
+        self.assertTrue(torch.allclose(mlp(x), compiled(x)))
+
+    def test_flatten_empty_batch(self):
+        mlp = MultiLayerPerceptron(10, [4], 3).build()
+        y = mlp(torch.randn(0, 2, 5))
+        self.assertEqual(y.shape, (0, 3))
+
+    def test_param_dtype(self):
+        mlp = MultiLayerPerceptron(2, [4], 3, param_dtype=torch.bfloat16).build()
+        for param in mlp.parameters():
+            self.assertEqual(param.dtype, torch.bfloat16)
+
+        y = mlp(torch.randn(2, 2, dtype=torch.bfloat16))
+        self.assertEqual(y.dtype, torch.bfloat16)
+
+    def test_param_dtype_reconfigured(self):
+        mlp = MultiLayerPerceptron(2, [4], 3, param_dtype=torch.bfloat16)
+        mlp.configure(param_dtype=torch.float16)
+        mlp.configure(param_dtype=None)
+        mlp.build()
+        for param in mlp.parameters():
+            self.assertEqual(param.dtype, torch.float32)
+
+        mlp = MultiLayerPerceptron(2, [4], 3)
+        mlp.configure(param_dtype=torch.float16)
+        mlp.build()
+        for param in mlp.parameters():
+            self.assertEqual(param.dtype, torch.float16)
+
+    def test_mlp_input_shape(self):
+        mlp = MultiLayerPerceptron(None, [4], 3, input_shape=(2, 5)).build()
+        self.assertIsInstance(mlp.blocks[0].layer, nn.Linear)
+        self.assertEqual(mlp.blocks[0].layer.in_features, 10)
+
+        y = mlp(torch.randn(2, 2, 5))
+        self.assertEqual(y.shape, (2, 3))
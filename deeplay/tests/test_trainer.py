@@ -76,3 +76,22 @@ class TestTrainer(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             trainer.history
+
+    def test_trainer_is_set_on_nested_applications(self):
+        trainer = Trainer(max_epochs=1)
+        model = Regressor(nn.Linear(1, 1))
+        for _ in range(5):
+            model = Regressor(model)
+        model = model.create()
+
+        with patch.object(
+            nn.Module, "modules", autospec=True, side_effect=nn.Module.modules
+        ) as modules:
+            model.trainer = trainer
+
+        # A single traversal reaches all nested applications.
+        self.assertEqual(modules.call_count, 1)
+
+        for module in model.modules():
+            if isinstance(module, L.LightningModule):
+                self.assertIs(module.trainer, trainer)